@@ -20,11 +20,14 @@ namespace utilities {
 static std::size_t
 read_line(std::istream& s, std::string& line, std::string_view comment_begin = "#")
 {
-    // Lambda that trims a string in-place from leading/trailing space characters.
-    auto trim = [](std::string& str) {
-        str.erase(str.begin(), std::find_if(str.begin(), str.end(), [](int ch) { return !std::isspace(ch); }));
+    // Lambdas that trim a string in-place from trailing and from leading/trailing space characters.
+    auto trim_right = [](std::string& str) {
         str.erase(std::find_if(str.rbegin(), str.rend(), [](int ch) { return !std::isspace(ch); }).base(), str.end());
     };
+    auto trim = [&trim_right](std::string& str) {
+        str.erase(str.begin(), std::find_if(str.begin(), str.end(), [](int ch) { return !std::isspace(ch); }));
+        trim_right(str);
+    };
 
     // Zap any existing content in the output parameter.
     line.clear();
@@ -50,11 +53,11 @@ read_line(std::istream& s, std::string& line, std::string_view comment_begin = "
 
         // Handle continuation lines (we know that n != 0).
         if (line[n - 1] == '\\') {
-            // Replace the continuation character with a space
-            line[n - 1] = ' ';
+            // Drop the continuation character.
+            line.pop_back();
 
-            // Trim--we'll add one space back if there is a non-empty continuation.
-            trim(line);
+            // The front is already trimmed so just trim the back--we'll add one space back if there is a continuation.
+            trim_right(line);
 
             // Recurse ...
             std::string continuation;
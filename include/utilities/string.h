@@ -84,14 +84,28 @@ replace_right(std::string& str, std::string_view target, std::string_view replac
 /// @param str string to be be converted.
 /// @param target the target substring to hunt for.
 /// @param replacement what we replace all occurrences of the target with.
+/// @note  Builds the result in one pass so the tail of the string isn't shifted for every match.
 inline void
 replace(std::string& str, std::string_view target, std::string_view replacement)
 {
-    std::size_t p = 0;
-    while ((p = str.find(target, p)) != std::string::npos) {
-        str.replace(p, target.length(), replacement);
-        p += replacement.length();
-    }
+    // An empty target matches everywhere so there is nothing sensible to do.
+    if (target.empty()) return;
+
+    // Early exit if there is nothing to replace.
+    std::size_t p = str.find(target);
+    if (p == std::string::npos) return;
+
+    // Copy the stretches between matches into the result, swapping in the replacement for each match.
+    std::string result;
+    result.reserve(str.length());
+    std::size_t b = 0;
+    do {
+        result.append(str, b, p - b);
+        result.append(replacement);
+        b = p + target.length();
+    } while ((p = str.find(target, b)) != std::string::npos);
+    result.append(str, b);
+    str = std::move(result);
 }
 
 /// @brief Replace all contiguous white space sequences in a string in-place.
@@ -101,7 +115,7 @@ inline void
 replace_space(std::string& s, const std::string& with = " ", bool also_trim = true)
 {
     if (also_trim) trim(s);
-    std::regex ws{R"(\s+)"};
+    static const std::regex ws{R"(\s+)"};
     s = std::regex_replace(s, ws, with);
 }
 
@@ -139,8 +153,7 @@ erase_right(std::string& str, std::string_view target)
 inline void
 erase(std::string& str, std::string_view target)
 {
-    std::size_t p = 0;
-    while ((p = str.find(target, p)) != std::string::npos) str.erase(p, target.length());
+    replace(str, target, "");
 }
 
 /// @brief Removes "surrounds" from a @c std::string so for example: (text) -> text.  Conversion is in-place.
@@ -148,15 +161,17 @@ erase(std::string& str, std::string_view target)
 inline void
 remove_surrounds(std::string& s)
 {
+    // We peel off matching surrounds by moving a window [b, b + len) inward and only touch the string once at the end.
+    std::size_t b = 0;
     std::size_t len = s.length();
     while (len > 1) {
         // If the first character is alpha-numeric we are done.
-        char first = s[0];
-        if (isalnum(first)) return;
+        char first = s[b];
+        if (isalnum(first)) break;
 
         // First character is not alpha-numeric.
         // Grab the last character & check for a match.
-        char last = s[len - 1];
+        char last = s[b + len - 1];
         bool match = false;
 
         // Handle cases [text], {text}, <text>, and (text) and then all others
@@ -178,15 +193,18 @@ remove_surrounds(std::string& s)
                 break;
         }
 
-        if (match) {
-            // Shrink the string and continue
-            s = s.substr(1, len - 2);
-            len -= 2;
-        }
-        else {
-            // No match => no surround so we can exit.
-            return;
-        }
+        // No match => no surround so we can exit.
+        if (!match) break;
+
+        // Shrink the window and continue
+        ++b;
+        len -= 2;
+    }
+
+    // Cut the string down to the final window (if it moved at all).
+    if (b > 0) {
+        s.erase(b + len);
+        s.erase(0, b);
     }
 }
 
@@ -365,7 +383,7 @@ standardized(std::string_view input)
 inline bool
 starts_with(std::string_view str, std::string_view prefix)
 {
-    return str.find(prefix) == 0;
+    return str.starts_with(prefix);
 }
 
 /// @brief Check if a string ends with a particular suffix string.
@@ -374,8 +392,7 @@ starts_with(std::string_view str, std::string_view prefix)
 inline bool
 ends_with(std::string_view str, std::string_view suffix)
 {
-    const auto pos = str.rfind(suffix);
-    return (pos != std::string::npos) && (pos == (str.length() - suffix.length()));
+    return str.ends_with(suffix);
 }
 
 /// @brief Try to read a value of a particular type from a @c std::string.
@@ -441,7 +458,6 @@ inline std::vector<std::string>
 split(std::string_view input, std::string_view delimiters = "\t,;: ", bool skip = true)
 {
     std::vector<std::string> output;
-    output.reserve(input.size() / 2);
     tokenize(input, output, delimiters, skip);
     return output;
 }
@@ -457,7 +473,9 @@ template<typename Iter, typename Traits, typename CharT, typename UnaryFunction>
 std::basic_string<CharT>
 regex_replace(Iter ib, Iter ie, const std::basic_regex<CharT, Traits>& re, UnaryFunction f)
 {
+    // The output is usually about the size of the input so we reserve that much up front to limit reallocations.
     std::basic_string<CharT> s;
+    s.reserve(static_cast<std::size_t>(std::distance(ib, ie)));
 
     using diff_t = typename std::match_results<Iter>::difference_type;
     diff_t match_pos_old = 0;